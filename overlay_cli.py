@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 from typing import Dict, Optional
 
-from overlay_config import default_env_path, load_config
+from overlay_config import default_env_path, load_config, load_env_file
 from overlay_server import run_server
 from setup_wizard import (
     is_interactive,
@@ -58,21 +58,24 @@ def main(argv: Optional[list[str]] = None) -> None:
 
     env_path = default_env_path() if not args.env_file else Path(args.env_file)
 
+    # Read the .env once for whichever setup flow runs (GUI may fall back to CLI).
+    existing = load_env_file(env_path) if (args.gui or args.setup) else None
+
     if args.gui:
         if not tkinter_available():
             print("GUI setup is unavailable on this Python install; using the CLI setup instead.\n")
-            run_cli_setup(env_path)
+            run_cli_setup(env_path, existing)
             if args.setup_only:
                 return
         else:
-            start = run_gui_setup(env_path)
+            start = run_gui_setup(env_path, existing)
             if start is None and args.setup_only:
                 return
             if args.setup_only and start is False:
                 return
 
     if args.setup and not args.gui:
-        run_cli_setup(env_path)
+        run_cli_setup(env_path, existing)
         if args.setup_only:
             return
 
@@ -150,11 +150,32 @@ ENV_KEY_ORDER: tuple[str, ...] = (
 )
 
 
+# Parsed .env contents keyed by path. Each entry carries the
+# (st_mtime_ns, st_size) signature it was parsed from so edits made outside
+# the process are picked up on the next load.
+_ENV_FILE_CACHE: Dict[str, tuple[tuple[int, int], Dict[str, str]]] = {}
+
+
 def load_env_file(env_path: Path) -> Dict[str, str]:
-    env_values: Dict[str, str] = {}
-    if not env_path.exists():
-        return env_values
+    try:
+        stat = env_path.stat()
+    except OSError:
+        return {}
 
+    key = os.fspath(env_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _ENV_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        # Callers may mutate the result; hand out a copy.
+        return dict(cached[1])
+
+    env_values = _parse_env_file(env_path)
+    _ENV_FILE_CACHE[key] = (signature, env_values)
+    return dict(env_values)
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, str]:
+    env_values: Dict[str, str] = {}
     for raw_line in env_path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
@@ -184,6 +205,8 @@ def write_env_file(env_path: Path, values: Dict[str, str]) -> None:
         lines.append(f"{key}={values[key]}")
 
     env_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    # The mtime signature may not change on coarse-grained filesystems.
+    _ENV_FILE_CACHE.pop(os.fspath(env_path), None)
 
 
 def load_config(
@@ -1,15 +1,80 @@
 from __future__ import annotations
 
-import getpass
+import functools
 import importlib.util
+import math
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Callable, Optional
 
-from navidrome_api import detect_subsonic_api_version, fetch_now_playing
 from overlay_config import load_config, load_env_file, write_env_file
 
 
+_HTTP_SCHEMES: tuple[str, ...] = ("http://", "https://")
+
+_TRUE_SET: frozenset[str] = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_SET: frozenset[str] = frozenset({"0", "false", "no", "n", "off"})
+
+# Max number of scaled "Nothing playing" images kept for the GUI preview.
+_PLACEHOLDER_SCALED_CACHE_SIZE = 8
+
+# rgb(r, g, b) / rgba(r, g, b, a); group 4 (alpha) is None for rgb().
+_CSS_NUM = r"(\d+(?:\.\d*)?|\.\d+)"
+_RGBA_RE = re.compile(
+    rf"rgba?\(\s*{_CSS_NUM}\s*,\s*{_CSS_NUM}\s*,\s*{_CSS_NUM}(?:\s*,\s*{_CSS_NUM})?\s*\)",
+    re.IGNORECASE,
+)
+
+FONT_PRESETS: dict[str, str] = {
+    "Default (Segoe UI)": '"Segoe UI", sans-serif',
+    "Arial": '"Arial", sans-serif',
+    "Verdana": '"Verdana", sans-serif',
+    "Tahoma": '"Tahoma", sans-serif',
+    "Trebuchet MS": '"Trebuchet MS", sans-serif',
+    "Helvetica": '"Helvetica", Arial, sans-serif',
+    "Georgia": '"Georgia", serif',
+    "Times New Roman": '"Times New Roman", serif',
+    "Consolas (mono)": '"Consolas", monospace',
+    "Cascadia Mono (mono)": '"Cascadia Mono", monospace',
+}
+_FONT_PRESETS_REV: dict[str, str] = {css: label for label, css in FONT_PRESETS.items()}
+
+PLACEHOLDER_OPTIONS: dict[str, str] = {
+    "Dark image": "dark",
+    "Light image": "light",
+    "Icon only": "off",
+}
+_PLACEHOLDER_OPTIONS_REV: dict[str, str] = {
+    value: label for label, value in PLACEHOLDER_OPTIONS.items()
+}
+
+# (tkvars key, .env key, default) for the plain text fields of the GUI wizard.
+_STRINGVAR_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("url", "NAVIDROME_URL", "http://localhost:4533"),
+    ("user", "NAVIDROME_USER", ""),
+    ("pass", "NAVIDROME_PASSWORD", ""),
+    ("client", "NAVIDROME_CLIENT_NAME", "obs-overlay"),
+    ("version", "NAVIDROME_API_VERSION", "1.16.1"),
+    ("timeout", "NAVIDROME_TIMEOUT", "6"),
+    ("host", "OVERLAY_HOST", "127.0.0.1"),
+    ("port", "OVERLAY_PORT", "8080"),
+    ("refresh", "OVERLAY_REFRESH_SECONDS", "1"),
+    ("theme_font", "OVERLAY_THEME_FONT_FAMILY", '"Segoe UI", sans-serif'),
+    ("theme_text_color", "OVERLAY_THEME_TEXT_COLOR", "#f4f4f5"),
+    ("theme_card_bg", "OVERLAY_THEME_CARD_BG", "rgba(10, 10, 10, 0.75)"),
+    ("theme_card_radius", "OVERLAY_THEME_CARD_RADIUS_PX", "14"),
+    ("theme_accent_start", "OVERLAY_THEME_ACCENT_START", "#60a5fa"),
+    ("theme_accent_end", "OVERLAY_THEME_ACCENT_END", "#34d399"),
+    ("theme_cover_size", "OVERLAY_THEME_COVER_SIZE_PX", "96"),
+    ("theme_min_width", "OVERLAY_THEME_CARD_MIN_WIDTH_PX", "320"),
+    ("theme_title_size", "OVERLAY_THEME_TITLE_SIZE_PX", "18"),
+    ("theme_artist_size", "OVERLAY_THEME_ARTIST_SIZE_PX", "14"),
+)
+
+
 def tkinter_available() -> bool:
     return importlib.util.find_spec("tkinter") is not None
 
@@ -22,13 +87,63 @@ def is_interactive() -> bool:
 
 
 def parse_bool(value: str) -> bool:
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUE_SET
+
+
+def _to_int(raw: str) -> int:
+    """Parse an integer, tolerating float text like "6.0"; raises ValueError.
 
+    Plain digit strings (the common case) skip the float detour.
+    """
 
-def prompt(text: str, default: Optional[str] = None) -> str:
-    suffix = f" [{default}]" if default not in (None, "") else ""
+    if raw.lstrip("-").isdigit():
+        return int(raw)
+    try:
+        return int(float(raw))
+    except OverflowError:  # "inf", "1e999"
+        raise ValueError(f"integer out of range: {raw!r}") from None
+
+
+def _env_int(existing: dict[str, str], key: str, default: int) -> int:
+    raw = (existing.get(key) or "").strip()
+    if not raw:
+        return default
+    try:
+        return _to_int(raw)
+    except ValueError:
+        return default
+
+
+def _read_line(text: str, default: Optional[str], *, prefill: bool = True) -> str:
+    """Read one stripped line, offering ``default`` for the user to accept or edit.
+
+    With ``prefill`` and readline on a terminal the default is pre-filled in the
+    input buffer; otherwise it is shown as a ``[default]`` suffix. Pass
+    ``prefill=False`` for short answers (yes/no, choices, numbers) where typed
+    text would otherwise be appended to the default.
+    """
+
+    if not default:
+        return input(f"{text}: ").strip()
+    plain_label = f"{text} [{default}]: "
+    if not (prefill and sys.stdin.isatty() and sys.stdout.isatty()):
+        return input(plain_label).strip()
+    try:
+        # Imported here so importing this module (e.g. on server start) stays cheap.
+        import readline
+    except ImportError:  # Windows and builds without GNU readline/libedit
+        return input(plain_label).strip()
+
+    readline.set_startup_hook(lambda: readline.insert_text(default))
+    try:
+        return input(f"{text}: ").strip()
+    finally:
+        readline.set_startup_hook()
+
+
+def prompt(text: str, default: Optional[str] = None, *, prefill: bool = True) -> str:
     while True:
-        entered = input(f"{text}{suffix}: ").strip()
+        entered = _read_line(text, default, prefill=prefill)
         if entered:
             return entered
         if default is not None:
@@ -36,14 +151,18 @@ def prompt(text: str, default: Optional[str] = None) -> str:
 
 
 def prompt_int(text: str, default: int, minimum: int = 1, maximum: int = 65535) -> int:
+    default_str = str(default)
     while True:
-        raw = prompt(text, str(default))
-        try:
-            value = int(raw)
-        except ValueError:
-            print("Please enter a number.")
-            continue
-        if value < minimum or value > maximum:
+        raw = _read_line(text, default_str, prefill=False)
+        if not raw:
+            value = default
+        else:
+            try:
+                value = int(raw, 10)
+            except ValueError:
+                print("Please enter a number.")
+                continue
+        if not minimum <= value <= maximum:
             print(f"Please enter a value between {minimum} and {maximum}.")
             continue
         return value
@@ -52,21 +171,30 @@ def prompt_int(text: str, default: int, minimum: int = 1, maximum: int = 65535)
 def prompt_bool(text: str, default: bool) -> bool:
     default_str = "yes" if default else "no"
     while True:
-        raw = prompt(f"{text} (yes/no)", default_str).strip().lower()
-        if raw in {"yes", "y", "1", "true", "on"}:
+        raw = prompt(f"{text} (yes/no)", default_str, prefill=False).strip().lower()
+        if raw in _TRUE_SET:
             return True
-        if raw in {"no", "n", "0", "false", "off"}:
+        if raw in _FALSE_SET:
             return False
         print("Please enter yes or no.")
 
 
-def run_cli_setup(env_path: Path) -> None:
-    existing = load_env_file(env_path)
+def run_cli_setup(env_path: Path, existing: Optional[dict[str, str]] = None) -> None:
+    """Prompt for settings and write them to env_path.
+
+    Pass ``existing`` when the caller already parsed env_path to skip re-reading it.
+    """
+
+    # Deferred so importing this module stays cheap for callers that never prompt.
+    import getpass
+
+    if existing is None:
+        existing = load_env_file(env_path)
     print("\nNavidrome OBS Overlay - guided setup\n")
 
     navidrome_url_default = existing.get("NAVIDROME_URL", "http://localhost:4533")
     navidrome_url = prompt("Navidrome URL", navidrome_url_default).rstrip("/")
-    while not (navidrome_url.startswith("http://") or navidrome_url.startswith("https://")):
+    while not navidrome_url.startswith(_HTTP_SCHEMES):
         print("Please enter a URL that starts with http:// or https://")
         navidrome_url = prompt("Navidrome URL", navidrome_url_default).rstrip("/")
 
@@ -89,12 +217,12 @@ def run_cli_setup(env_path: Path) -> None:
         "Subsonic API version", existing.get("NAVIDROME_API_VERSION", "1.16.1")
     )
     timeout = prompt_int(
-        "Request timeout (seconds)", int(float(existing.get("NAVIDROME_TIMEOUT", "6") or "6")), 1, 120
+        "Request timeout (seconds)", _env_int(existing, "NAVIDROME_TIMEOUT", 6), 1, 120
     )
     host = prompt("Overlay host", existing.get("OVERLAY_HOST", "127.0.0.1"))
-    port = prompt_int("Overlay port", int(existing.get("OVERLAY_PORT", "8080") or "8080"), 1, 65535)
+    port = prompt_int("Overlay port", _env_int(existing, "OVERLAY_PORT", 8080), 1, 65535)
     refresh = prompt_int(
-        "Refresh interval (seconds)", int(existing.get("OVERLAY_REFRESH_SECONDS", "1") or "1"), 1, 60
+        "Refresh interval (seconds)", _env_int(existing, "OVERLAY_REFRESH_SECONDS", 1), 1, 60
     )
 
     expand_width = prompt_bool(
@@ -106,7 +234,7 @@ def run_cli_setup(env_path: Path) -> None:
     if placeholder_default not in {"dark", "light", "off"}:
         placeholder_default = "dark"
     placeholder_choice = prompt(
-        "Nothing playing image (dark/light/off)", placeholder_default
+        "Nothing playing image (dark/light/off)", placeholder_default, prefill=False
     ).strip().lower()
     if placeholder_choice in {"none", "false", "0"}:
         placeholder_choice = "off"
@@ -131,305 +259,340 @@ def run_cli_setup(env_path: Path) -> None:
     write_env_file(env_path, values)
     print(f"\nSaved configuration to {env_path}\n")
 
-    try:
-        config = load_config(env_path)
-        _ = fetch_now_playing(config)
-        print("Navidrome connection check: OK (request succeeded)")
-    except Exception as exc:  # pylint: disable=broad-except
-        print(f"Navidrome connection check: FAILED ({type(exc).__name__}: {exc})")
-        print("You can still start the overlay; verify URL/credentials if needed.")
+    from navidrome_api import fetch_now_playing
+
+    # Run the check in the background so a slow server does not hold the CLI for
+    # the full request timeout; fast results still print before we return.
+    done = threading.Event()
+
+    def check_connection() -> None:
+        try:
+            config = load_config(env_path)
+            _ = fetch_now_playing(config)
+            print("Navidrome connection check: OK (request succeeded)")
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"Navidrome connection check: FAILED ({type(exc).__name__}: {exc})")
+            print("You can still start the overlay; verify URL/credentials if needed.")
+        finally:
+            done.set()
+
+    threading.Thread(target=check_connection, daemon=True).start()
+    if not done.wait(timeout=2.0):
+        print("Navidrome connection check: still waiting for the server; continuing.")
+
+
+# Color helpers for the GUI preview. They are pure string/tuple transforms that
+# run on every preview redraw, so results are memoized across redraws.
+
+
+@functools.lru_cache(maxsize=256)
+def _css_color_to_tk(raw: str, default: str) -> str:
+    """Convert a CSS-ish color to something Tk can use (best-effort)."""
+
+    value = (raw or "").strip()
+    if not value:
+        return default
+    if value.startswith("#"):
+        return value
+    if value[:4].lower() in ("rgb(", "rgba"):
+        match = _RGBA_RE.fullmatch(value)
+        if not match:
+            return default
+        try:
+            r, g, b = (min(255, int(float(c))) for c in match.group(1, 2, 3))
+        except OverflowError:  # hundreds of digits parse to float("inf")
+            return default
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+    # Named colors might work; otherwise, fall back.
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb(value: str) -> Optional[tuple[int, int, int]]:
+    v = (value or "").strip()
+    if not v.startswith("#"):
+        return None
+    h = v[1:]
+    if len(h) == 3:
+        try:
+            r = int(h[0] * 2, 16)
+            g = int(h[1] * 2, 16)
+            b = int(h[2] * 2, 16)
+            return (r, g, b)
+        except ValueError:
+            return None
+    if len(h) == 6:
+        try:
+            r = int(h[0:2], 16)
+            g = int(h[2:4], 16)
+            b = int(h[4:6], 16)
+            return (r, g, b)
+        except ValueError:
+            return None
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
+    # Clamp: int(x, 16) in _hex_to_rgb accepts signs, so "#-1-1-1" yields negatives.
+    r, g, b = rgb
+    return "#%02x%02x%02x" % (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
+
+
+def _mix8(bg: int, fg: int, a: int, ia: int) -> int:
+    # Rounded (bg * ia + fg * a) / 255 in integer math.
+    t = bg * ia + fg * a + 128
+    return (t + (t >> 8)) >> 8
 
 
-def run_gui_setup(env_path: Path) -> Optional[bool]:
-    """Returns True for Save&Start, False for Save, None for cancel."""
+def _blend8(bg: tuple[int, int, int], fg: tuple[int, int, int], a: int) -> tuple[int, int, int]:
+    """Blend fg over bg with an 8-bit alpha (0..255)."""
+
+    ia = 255 - a
+    return (_mix8(bg[0], fg[0], a, ia), _mix8(bg[1], fg[1], a, ia), _mix8(bg[2], fg[2], a, ia))
+
+
+@functools.lru_cache(maxsize=256)
+def _blend(bg: tuple[int, int, int], fg: tuple[int, int, int], alpha: float) -> tuple[int, int, int]:
+    # Clamp in float space first: min/max map nan and +/-inf into range, whereas
+    # int() on a scaled non-finite value raises.
+    a = max(0.0, min(1.0, float(alpha)))
+    return _blend8(bg, fg, int(a * 255 + 0.5))
+
+
+@functools.lru_cache(maxsize=256)
+def _rgba_to_rgb_approx(
+    css: str, fallback: tuple[int, int, int], bg: tuple[int, int, int]
+) -> tuple[int, int, int]:
+    """Resolve a CSS color to RGB, blending any rgba() alpha against ``bg``."""
+
+    v = (css or "").strip().lower()
+    if v.startswith("#"):
+        # Common case (hex theme colors): skip the rgb()/named-color ladder.
+        return _hex_to_rgb(v) or fallback
+    if v.startswith("rgb"):
+        match = _RGBA_RE.fullmatch(v)
+        if not match:
+            return fallback
+        r, g, b, a = match.groups()
+        try:
+            rgb = (min(255, int(float(r))), min(255, int(float(g))), min(255, int(float(b))))
+        except OverflowError:  # hundreds of digits parse to float("inf")
+            return fallback
+        if a is None:
+            return rgb
+        return _blend(bg, rgb, float(a))
+
+    rgb = _hex_to_rgb(_css_color_to_tk(css, _rgb_to_hex(fallback)))
+    return rgb or fallback
+
+
+# Tk can't do true alpha like CSS; rgba() colors are approximated by blending
+# against this dark "preview background" (#0b0b0b).
+_PREVIEW_BG_RGB: tuple[int, int, int] = (11, 11, 11)
+# Fallbacks matching the OverlayTheme defaults (card bg without alpha, text color).
+_CARD_BG_DEFAULT_RGB: tuple[int, int, int] = (10, 10, 10)
+_TEXT_DEFAULT_RGB: tuple[int, int, int] = (244, 244, 245)
+
+# Unit quarter-circle samples (0..90 degrees) used to build rounded corners.
+_ARC_STEPS = 8
+_QUARTER_ARC: tuple[tuple[float, float], ...] = tuple(
+    (math.cos(i * math.pi / (2 * (_ARC_STEPS - 1))), math.sin(i * math.pi / (2 * (_ARC_STEPS - 1))))
+    for i in range(_ARC_STEPS)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _round_rect_template(w: int, h: int, r: int) -> tuple[int, ...]:
+    """Polygon points for a w x h rounded rect at the origin (x, y pairs).
+
+    Corners are sampled explicitly so the polygon can be drawn with smooth=False
+    instead of having Tk tessellate a spline on every redraw.
+    """
+
+    rr = min(max(0, r), w // 2, h // 2)
+    if rr == 0:
+        return (0, 0, w, 0, w, h, 0, h)
+
+    points: list[int] = []
+    for cos_a, sin_a in _QUARTER_ARC:  # top-left
+        points += (round(rr - rr * cos_a), round(rr - rr * sin_a))
+    for cos_a, sin_a in _QUARTER_ARC:  # top-right
+        points += (round(w - rr + rr * sin_a), round(rr - rr * cos_a))
+    for cos_a, sin_a in _QUARTER_ARC:  # bottom-right
+        points += (round(w - rr + rr * cos_a), round(h - rr + rr * sin_a))
+    for cos_a, sin_a in _QUARTER_ARC:  # bottom-left
+        points += (round(rr - rr * sin_a), round(h - rr + rr * cos_a))
+    return tuple(points)
+
+
+# Material-ish theme (best-effort within Tkinter)
+_APP_BG = "#f5f5f5"  # gray 100
+_SURFACE = "#ffffff"
+_TEXT = "#202124"
+_TEXT_MUTED = "#5f6368"
+_PRIMARY = "#1976d2"  # blue 700
+_PRIMARY_HOVER = "#1565c0"
+_BORDER = "#e0e0e0"
+_SUCCESS = "#2e7d32"
+_ERROR = "#d32f2f"
+_FONT = "Segoe UI"
+
+# Wizard button looks by kind (the named button font is added per root).
+_BUTTON_BASE: dict[str, object] = {
+    "relief": "flat",
+    "bd": 0,
+    "highlightthickness": 0,
+    "cursor": "hand2",
+}
+_BUTTON_STYLES: dict[str, dict[str, object]] = {
+    "text": {
+        **_BUTTON_BASE,
+        "bg": _APP_BG,
+        "fg": _PRIMARY,
+        "activebackground": _APP_BG,
+        "activeforeground": _PRIMARY_HOVER,
+        "padx": 2,
+        "pady": 2,
+    },
+    "header_text": {
+        **_BUTTON_BASE,
+        "bg": _PRIMARY,
+        "fg": "#dbeafe",
+        "activebackground": _PRIMARY,
+        "activeforeground": "#ffffff",
+        "padx": 6,
+        "pady": 2,
+    },
+    # High-contrast CTA on the blue header.
+    "header_primary": {
+        **_BUTTON_BASE,
+        "bg": "#ffffff",
+        "fg": _PRIMARY,
+        "activebackground": "#e3f2fd",
+        "activeforeground": _PRIMARY,
+        "padx": 14,
+        "pady": 9,
+    },
+    "header_outlined": {
+        **_BUTTON_BASE,
+        "bg": _PRIMARY,
+        "fg": "#ffffff",
+        "activebackground": _PRIMARY_HOVER,
+        "activeforeground": "#ffffff",
+        "highlightthickness": 1,
+        "highlightbackground": "#bbdefb",
+        "highlightcolor": "#bbdefb",
+        "padx": 14,
+        "pady": 9,
+    },
+}
+
+
+def run_gui_setup(env_path: Path, existing: Optional[dict[str, str]] = None) -> Optional[bool]:
+    """Returns True for Save&Start, False for Save, None for cancel.
+
+    Pass ``existing`` when the caller already parsed env_path to skip re-reading it.
+    """
 
     try:
         import tkinter as tk
-        from tkinter import colorchooser, messagebox
+        from tkinter import colorchooser, messagebox, ttk
         from tkinter import font as tkfont
     except ImportError:
         return None
 
-    existing = load_env_file(env_path)
-
-    # Material-ish theme (best-effort within Tkinter)
-    APP_BG = "#f5f5f5"  # gray 100
-    SURFACE = "#ffffff"
-    TEXT = "#202124"
-    TEXT_MUTED = "#5f6368"
-    PRIMARY = "#1976d2"  # blue 700
-    PRIMARY_HOVER = "#1565c0"
-    BORDER = "#e0e0e0"
-    SUCCESS = "#2e7d32"
-    ERROR = "#d32f2f"
-    FONT = "Segoe UI"
+    if existing is None:
+        existing = load_env_file(env_path)
 
     root = tk.Tk()
+    # Stay hidden while the widget tree is built so geometry is settled in one pass.
+    root.withdraw()
+
+    # Shared named fonts: Tk resolves each variant once instead of per widget.
+    FONTS: dict[str, tkfont.Font] = {
+        "label": tkfont.Font(root, family=_FONT, size=9),
+        "button": tkfont.Font(root, family=_FONT, size=9, weight="bold"),
+        "body": tkfont.Font(root, family=_FONT, size=10),
+        "title": tkfont.Font(root, family=_FONT, size=10, weight="bold"),
+        "h1": tkfont.Font(root, family=_FONT, size=16, weight="bold"),
+    }
     root.title("Navidrome OBS Overlay Setup")
     root.geometry("860x860")
     root.minsize(720, 600)
     root.resizable(True, True)
-    root.configure(bg=APP_BG)
+    root.configure(bg=_APP_BG)
     root.columnconfigure(0, weight=1)
     root.rowconfigure(1, weight=1)
 
-    url_var = tk.StringVar(value=existing.get("NAVIDROME_URL", "http://localhost:4533"))
-    user_var = tk.StringVar(value=existing.get("NAVIDROME_USER", ""))
-    pass_var = tk.StringVar(value=existing.get("NAVIDROME_PASSWORD", ""))
-    client_var = tk.StringVar(value=existing.get("NAVIDROME_CLIENT_NAME", "obs-overlay"))
-    version_var = tk.StringVar(value=existing.get("NAVIDROME_API_VERSION", "1.16.1"))
-    timeout_var = tk.StringVar(value=existing.get("NAVIDROME_TIMEOUT", "6"))
-    host_var = tk.StringVar(value=existing.get("OVERLAY_HOST", "127.0.0.1"))
-    port_var = tk.StringVar(value=existing.get("OVERLAY_PORT", "8080"))
-    refresh_var = tk.StringVar(value=existing.get("OVERLAY_REFRESH_SECONDS", "1"))
+    # Entries are native themed widgets; one style drives all of them.
+    entry_style = ttk.Style(root)
+    if "clam" in entry_style.theme_names():
+        # The native Windows/macOS themes ignore fieldbackground/bordercolor.
+        entry_style.theme_use("clam")
+    entry_style.configure(
+        "Rounded.TEntry",
+        fieldbackground=_SURFACE,
+        foreground=_TEXT,
+        insertcolor=_TEXT,
+        bordercolor=_BORDER,
+        lightcolor=_SURFACE,
+        darkcolor=_SURFACE,
+        borderwidth=1,
+        relief="flat",
+        padding=(12, 8),
+    )
+    entry_style.map(
+        "Rounded.TEntry",
+        bordercolor=[("focus", _PRIMARY)],
+        lightcolor=[("focus", _PRIMARY)],
+    )
+
+    get_existing = existing.get
+    tkvars: dict[str, tk.StringVar] = {
+        name: tk.StringVar(value=get_existing(key, default))
+        for name, key, default in _STRINGVAR_SPEC
+    }
     expand_width_var = tk.BooleanVar(value=parse_bool(existing.get("OVERLAY_EXPAND_WIDTH", "false")))
 
     placeholder_value_var = tk.StringVar(
         value=(existing.get("OVERLAY_NOTHING_PLAYING_PLACEHOLDER", "dark") or "dark").strip().lower()
     )
-    PLACEHOLDER_OPTIONS: dict[str, str] = {
-        "Dark image": "dark",
-        "Light image": "light",
-        "Icon only": "off",
-    }
-    placeholder_label_var = tk.StringVar(value="Dark image")
-    for label, value in PLACEHOLDER_OPTIONS.items():
-        if placeholder_value_var.get() == value:
-            placeholder_label_var.set(label)
-            break
-
-    theme_font_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_FONT_FAMILY", '"Segoe UI", sans-serif')
-    )
-    theme_font_preset_var = tk.StringVar(value="Custom…")
-    theme_text_color_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_TEXT_COLOR", "#f4f4f5")
-    )
-    theme_card_bg_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_CARD_BG", "rgba(10, 10, 10, 0.75)")
-    )
-    theme_card_radius_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_CARD_RADIUS_PX", "14")
-    )
-    theme_accent_start_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_ACCENT_START", "#60a5fa")
-    )
-    theme_accent_end_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_ACCENT_END", "#34d399")
-    )
-    theme_cover_size_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_COVER_SIZE_PX", "96")
-    )
-    theme_min_width_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_CARD_MIN_WIDTH_PX", "320")
+    placeholder_label_var = tk.StringVar(
+        value=_PLACEHOLDER_OPTIONS_REV.get(placeholder_value_var.get(), "Dark image")
     )
-    theme_title_size_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_TITLE_SIZE_PX", "18")
-    )
-    theme_artist_size_var = tk.StringVar(
-        value=existing.get("OVERLAY_THEME_ARTIST_SIZE_PX", "14")
-    )
-
-    FONT_PRESETS: dict[str, str] = {
-        "Default (Segoe UI)": '"Segoe UI", sans-serif',
-        "Arial": '"Arial", sans-serif',
-        "Verdana": '"Verdana", sans-serif',
-        "Tahoma": '"Tahoma", sans-serif',
-        "Trebuchet MS": '"Trebuchet MS", sans-serif',
-        "Helvetica": '"Helvetica", Arial, sans-serif',
-        "Georgia": '"Georgia", serif',
-        "Times New Roman": '"Times New Roman", serif',
-        "Consolas (mono)": '"Consolas", monospace',
-        "Cascadia Mono (mono)": '"Cascadia Mono", monospace',
-    }
-
     # Best-effort: map existing CSS string back to a preset label.
-    current_font_value = theme_font_var.get().strip()
-    for label, css_value in FONT_PRESETS.items():
-        if current_font_value == css_value:
-            theme_font_preset_var.set(label)
-            break
+    theme_font_preset_var = tk.StringVar(
+        value=_FONT_PRESETS_REV.get(tkvars["theme_font"].get().strip(), "Custom…")
+    )
 
     start_choice: dict[str, Optional[bool]] = {"start": None}
 
     def make_card(parent: tk.Widget, title: str) -> tuple[tk.Frame, tk.Frame]:
-        card = tk.Frame(parent, bg=SURFACE, highlightthickness=1, highlightbackground=BORDER)
+        card = tk.Frame(parent, bg=_SURFACE, highlightthickness=1, highlightbackground=_BORDER)
         card_title = tk.Label(
             card,
             text=title,
-            bg=SURFACE,
-            fg=TEXT,
-            font=(FONT, 10, "bold"),
+            bg=_SURFACE,
+            fg=_TEXT,
+            font=FONTS["title"],
             anchor="w",
         )
         card_title.grid(row=0, column=0, sticky="ew", padx=14, pady=(12, 8))
-        body = tk.Frame(card, bg=SURFACE)
+        body = tk.Frame(card, bg=_SURFACE)
         body.grid(row=1, column=0, sticky="ew", padx=14, pady=(0, 14))
         card.columnconfigure(0, weight=1)
         body.columnconfigure(0, weight=1)
         body.columnconfigure(1, weight=1)
         return card, body
 
-    def style_text_button(button: tk.Button) -> None:
-        button.configure(
-            bg=APP_BG,
-            fg=PRIMARY,
-            activebackground=APP_BG,
-            activeforeground=PRIMARY_HOVER,
-            relief="flat",
-            bd=0,
-            highlightthickness=0,
-            font=(FONT, 9, "bold"),
-            cursor="hand2",
-            padx=2,
-            pady=2,
-        )
-
-    def style_header_text_button(button: tk.Button) -> None:
-        button.configure(
-            bg=PRIMARY,
-            fg="#dbeafe",
-            activebackground=PRIMARY,
-            activeforeground="#ffffff",
-            relief="flat",
-            bd=0,
-            highlightthickness=0,
-            font=(FONT, 9, "bold"),
-            cursor="hand2",
-            padx=6,
-            pady=2,
-        )
-
-    def style_header_primary_button(button: tk.Button) -> None:
-        # High-contrast CTA on the blue header.
-        button.configure(
-            bg="#ffffff",
-            fg=PRIMARY,
-            activebackground="#e3f2fd",
-            activeforeground=PRIMARY,
-            relief="flat",
-            bd=0,
-            highlightthickness=0,
-            font=(FONT, 9, "bold"),
-            cursor="hand2",
-            padx=14,
-            pady=9,
-        )
-
-    def style_header_outlined_button(button: tk.Button) -> None:
-        button.configure(
-            bg=PRIMARY,
-            fg="#ffffff",
-            activebackground=PRIMARY_HOVER,
-            activeforeground="#ffffff",
-            relief="flat",
-            bd=0,
-            highlightthickness=1,
-            highlightbackground="#bbdefb",
-            highlightcolor="#bbdefb",
-            font=(FONT, 9, "bold"),
-            cursor="hand2",
-            padx=14,
-            pady=9,
-        )
-
-    def _rounded_rect(
-        canvas: tk.Canvas,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        radius: int,
-        **kwargs: object,
-    ) -> int:
-        r = max(0, min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
-        points = [
-            x1 + r,
-            y1,
-            x2 - r,
-            y1,
-            x2,
-            y1,
-            x2,
-            y1 + r,
-            x2,
-            y2 - r,
-            x2,
-            y2,
-            x2 - r,
-            y2,
-            x1 + r,
-            y2,
-            x1,
-            y2,
-            x1,
-            y2 - r,
-            x1,
-            y1 + r,
-            x1,
-            y1,
-        ]
-        return canvas.create_polygon(points, smooth=True, splinesteps=24, **kwargs)
-
-    def make_rounded_entry(
-        parent: tk.Widget, variable: tk.Variable, *, show: Optional[str] = None
-    ) -> tuple[tk.Frame, tk.Entry]:
-        container = tk.Frame(parent, bg=SURFACE)
-        canvas = tk.Canvas(container, bg=SURFACE, highlightthickness=0, bd=0, height=36)
-        canvas.pack(fill="x", expand=True)
-
-        entry = tk.Entry(
-            canvas,
-            textvariable=variable,
-            show=show,
-            relief="flat",
-            bd=0,
-            bg=SURFACE,
-            fg=TEXT,
-            insertbackground=TEXT,
-            font=(FONT, 10),
-        )
-
-        entry_window = canvas.create_window(14, 18, window=entry, anchor="w")
-        state: dict[str, str] = {"border": BORDER}
-
-        def redraw() -> None:
-            canvas.delete("shape")
-            width = canvas.winfo_width()
-            height = canvas.winfo_height()
-            if width <= 2 or height <= 2:
-                return
-            _rounded_rect(
-                canvas,
-                1,
-                1,
-                width - 1,
-                height - 1,
-                10,
-                fill=SURFACE,
-                outline=state["border"],
-                width=1,
-                tags=("shape",),
-            )
-            canvas.tag_lower("shape")
-            canvas.coords(entry_window, 14, height // 2)
-            canvas.itemconfigure(entry_window, width=max(10, width - 28), height=max(10, height - 12))
-
-        def on_focus_in(_event: object) -> None:
-            state["border"] = PRIMARY
-            redraw()
-
-        def on_focus_out(_event: object) -> None:
-            state["border"] = BORDER
-            redraw()
+    def style_button(button: tk.Button, kind: str) -> None:
+        button.configure(font=FONTS["button"], **_BUTTON_STYLES[kind])
 
-        canvas.bind("<Configure>", lambda _e: redraw())
-        entry.bind("<FocusIn>", on_focus_in)
-        entry.bind("<FocusOut>", on_focus_out)
-        entry.bind("<Return>", lambda _e: None)
-        container.after_idle(redraw)
-
-        return container, entry
+    # Entries carry this bindtag so one class binding clears the status line on edits.
+    # It sits after the widget's class tag so handlers see the text after the edit.
+    CLEAR_STATUS_TAG = "WizardClearStatus"
 
     def add_field(
         parent: tk.Frame,
@@ -441,7 +604,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         show: Optional[str] = None,
         colspan: int = 1,
     ) -> tk.Entry:
-        tk.Label(parent, text=label, bg=SURFACE, fg=TEXT_MUTED, font=(FONT, 9), anchor="w").grid(
+        tk.Label(parent, text=label, bg=_SURFACE, fg=_TEXT_MUTED, font=FONTS["label"], anchor="w").grid(
             row=row * 2,
             column=col,
             columnspan=colspan,
@@ -449,8 +612,12 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
             pady=(0, 3),
             padx=(0, 12) if col == 0 else 0,
         )
-        entry_container, entry = make_rounded_entry(parent, variable, show=show)
-        entry_container.grid(
+        entry = ttk.Entry(
+            parent, textvariable=variable, show=show, style="Rounded.TEntry", font=FONTS["body"]
+        )
+        tags = entry.bindtags()
+        entry.bindtags((*tags[:2], CLEAR_STATUS_TAG, *tags[2:]))
+        entry.grid(
             row=row * 2 + 1,
             column=col,
             columnspan=colspan,
@@ -470,26 +637,30 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         button_text: str,
         command: object,
         show: Optional[str] = None,
-    ) -> tk.Entry:
-        tk.Label(parent, text=label, bg=SURFACE, fg=TEXT_MUTED, font=(FONT, 9), anchor="w").grid(
+    ) -> tuple[tk.Entry, tk.Button]:
+        tk.Label(parent, text=label, bg=_SURFACE, fg=_TEXT_MUTED, font=FONTS["label"], anchor="w").grid(
             row=row * 2,
             column=col,
             sticky="w",
             pady=(0, 3),
         )
 
-        row_frame = tk.Frame(parent, bg=SURFACE)
+        row_frame = tk.Frame(parent, bg=_SURFACE)
         row_frame.grid(row=row * 2 + 1, column=col, sticky="ew", pady=(0, 12))
         row_frame.columnconfigure(0, weight=1)
 
-        entry_container, entry = make_rounded_entry(row_frame, variable, show=show)
-        entry_container.grid(row=0, column=0, sticky="ew")
+        entry = ttk.Entry(
+            row_frame, textvariable=variable, show=show, style="Rounded.TEntry", font=FONTS["body"]
+        )
+        tags = entry.bindtags()
+        entry.bindtags((*tags[:2], CLEAR_STATUS_TAG, *tags[2:]))
+        entry.grid(row=0, column=0, sticky="ew")
 
         button = tk.Button(row_frame, text=button_text, command=command)
-        style_text_button(button)
+        style_button(button, "text")
         button.grid(row=0, column=1, sticky="e", padx=(10, 0))
 
-        return entry
+        return entry, button
 
     def add_dropdown(
         parent: tk.Frame,
@@ -501,7 +672,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         *,
         colspan: int = 1,
     ) -> tk.OptionMenu:
-        tk.Label(parent, text=label, bg=SURFACE, fg=TEXT_MUTED, font=(FONT, 9), anchor="w").grid(
+        tk.Label(parent, text=label, bg=_SURFACE, fg=_TEXT_MUTED, font=FONTS["label"], anchor="w").grid(
             row=row * 2,
             column=col,
             columnspan=colspan,
@@ -510,7 +681,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
             padx=(0, 12) if col == 0 else 0,
         )
 
-        container = tk.Frame(parent, bg=SURFACE)
+        container = tk.Frame(parent, bg=_SURFACE)
         container.grid(
             row=row * 2 + 1,
             column=col,
@@ -521,23 +692,23 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         )
         container.columnconfigure(0, weight=1)
 
-        menu = tk.OptionMenu(container, variable, *options)
+        menu = tk.OptionMenu(container, variable, *options, command=clear_status)
         menu.configure(
-            bg=SURFACE,
-            fg=TEXT,
+            bg=_SURFACE,
+            fg=_TEXT,
             activebackground="#f0f0f0",
-            activeforeground=TEXT,
+            activeforeground=_TEXT,
             relief="flat",
             bd=0,
             highlightthickness=1,
-            highlightbackground=BORDER,
-            highlightcolor=BORDER,
-            font=(FONT, 10),
+            highlightbackground=_BORDER,
+            highlightcolor=_BORDER,
+            font=FONTS["body"],
             cursor="hand2",
             padx=8,
             pady=6,
         )
-        menu["menu"].configure(bg=SURFACE, fg=TEXT, activebackground="#eeeeee")
+        menu["menu"].configure(bg=_SURFACE, fg=_TEXT, activebackground="#eeeeee")
         menu.grid(row=0, column=0, sticky="ew")
         return menu
 
@@ -550,22 +721,21 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
 
         # If the existing value is rgba(..., a) keep its alpha when replacing.
         if prefer_rgba_alpha_from is not None:
-            raw = prefer_rgba_alpha_from.get().strip()
-            if raw.lower().startswith("rgba(") and raw.endswith(")"):
+            match = _RGBA_RE.fullmatch(prefer_rgba_alpha_from.get().strip())
+            if match and match.group(4) is not None:
                 try:
-                    inner = raw[5:-1]
-                    parts = [p.strip() for p in inner.split(",")]
-                    if len(parts) == 4:
-                        alpha = float(parts[3])
-                        r = int(hex_color[1:3], 16)
-                        g = int(hex_color[3:5], 16)
-                        b = int(hex_color[5:7], 16)
-                        var.set(f"rgba({r}, {g}, {b}, {alpha:g})")
-                        return
-                except Exception:  # pylint: disable=broad-except
+                    alpha = float(match.group(4))
+                    r = int(hex_color[1:3], 16)
+                    g = int(hex_color[3:5], 16)
+                    b = int(hex_color[5:7], 16)
+                    var.set(f"rgba({r}, {g}, {b}, {alpha:g})")
+                    clear_status()
+                    return
+                except ValueError:
                     pass
 
         var.set(hex_color)
+        clear_status()
 
     def enable_color_picker_on_click(
         entry: tk.Entry,
@@ -592,65 +762,76 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         entry.bind("<Button-1>", on_click, add=True)
 
     # Layout root
-    header = tk.Frame(root, bg=PRIMARY)
+    header = tk.Frame(root, bg=_PRIMARY)
     header.grid(row=0, column=0, sticky="ew")
     header.columnconfigure(0, weight=1)
     header.columnconfigure(1, weight=0)
     tk.Label(
         header,
         text="Navidrome OBS Overlay",
-        bg=PRIMARY,
+        bg=_PRIMARY,
         fg="#ffffff",
-        font=(FONT, 16, "bold"),
+        font=FONTS["h1"],
         anchor="w",
     ).grid(row=0, column=0, sticky="ew", padx=18, pady=(14, 2))
     tk.Label(
         header,
         text="Setup",
-        bg=PRIMARY,
+        bg=_PRIMARY,
         fg="#dbeafe",
-        font=(FONT, 10),
+        font=FONTS["body"],
         anchor="w",
     ).grid(row=1, column=0, sticky="ew", padx=18, pady=(0, 12))
 
-    header_actions = tk.Frame(header, bg=PRIMARY)
+    header_actions = tk.Frame(header, bg=_PRIMARY)
     header_actions.grid(row=0, column=1, rowspan=2, sticky="e", padx=(0, 18), pady=(12, 12))
 
     header_test_button = tk.Button(header_actions, text="Test connection", command=lambda: None)
-    style_header_text_button(header_test_button)
+    style_button(header_test_button, "header_text")
     header_test_button.grid(row=0, column=0, sticky="e", padx=(0, 10))
 
     header_save_button = tk.Button(header_actions, text="Save", command=lambda: None)
-    style_header_outlined_button(header_save_button)
+    style_button(header_save_button, "header_outlined")
     header_save_button.grid(row=0, column=1, sticky="e", padx=(0, 10))
 
     header_start_button = tk.Button(header_actions, text="Save & Start", command=lambda: None)
-    style_header_primary_button(header_start_button)
+    style_button(header_start_button, "header_primary")
     header_start_button.grid(row=0, column=2, sticky="e")
 
     # Scrollable content (so the window can resize and scroll on overflow)
-    scroll_area = tk.Frame(root, bg=APP_BG)
+    scroll_area = tk.Frame(root, bg=_APP_BG)
     scroll_area.grid(row=1, column=0, sticky="nsew")
     scroll_area.columnconfigure(0, weight=1)
     scroll_area.rowconfigure(0, weight=1)
 
-    scroll_canvas = tk.Canvas(scroll_area, bg=APP_BG, highlightthickness=0, bd=0)
+    scroll_canvas = tk.Canvas(scroll_area, bg=_APP_BG, highlightthickness=0, bd=0)
     scroll_canvas.grid(row=0, column=0, sticky="nsew")
 
     v_scrollbar = tk.Scrollbar(scroll_area, orient="vertical", command=scroll_canvas.yview)
     v_scrollbar.grid(row=0, column=1, sticky="ns")
     scroll_canvas.configure(yscrollcommand=v_scrollbar.set)
 
-    content = tk.Frame(scroll_canvas, bg=APP_BG)
+    content = tk.Frame(scroll_canvas, bg=_APP_BG)
     content.columnconfigure(0, weight=1)
     content_window = scroll_canvas.create_window((0, 0), window=content, anchor="nw")
 
-    def _on_content_configure(_event: object) -> None:
+    # Last sizes applied by the <Configure> handlers; moves and height-only
+    # relayouts fire <Configure> too and need no work.
+    scroll_sizes: dict[str, object] = {"content": None, "canvas_width": None}
+
+    def _on_content_configure(event: tk.Event) -> None:
+        size = (event.width, event.height)
+        if size == scroll_sizes["content"]:
+            return
+        scroll_sizes["content"] = size
         scroll_canvas.configure(scrollregion=scroll_canvas.bbox("all"))
 
-    def _on_canvas_configure(_event: object) -> None:
+    def _on_canvas_configure(event: tk.Event) -> None:
+        width = event.width
+        if width == scroll_sizes["canvas_width"]:
+            return
+        scroll_sizes["canvas_width"] = width
         # Make the inner frame match the available canvas width.
-        width = scroll_canvas.winfo_width()
         scroll_canvas.itemconfigure(content_window, width=width)
         # Keep the status label wrapping sensible as the window width changes.
         try:
@@ -661,23 +842,28 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
     content.bind("<Configure>", _on_content_configure)
     scroll_canvas.bind("<Configure>", _on_canvas_configure)
 
-    def _on_mousewheel(event: object) -> None:
+    def _on_mousewheel(event: tk.Event) -> None:
         # Windows: event.delta is multiples of 120.
-        delta = getattr(event, "delta", 0)
+        delta = event.delta
         if delta:
-            scroll_canvas.yview_scroll(int(-1 * (delta / 120)), "units")
+            units = abs(delta) // 120
+            if units:
+                scroll_canvas.yview_scroll(-units if delta > 0 else units, "units")
 
-    scroll_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    # Only route the wheel while the pointer is over the scrollable area; children
+    # (entries, labels) receive the events, so bind globally just for that span.
+    scroll_area.bind("<Enter>", lambda _e: scroll_canvas.bind_all("<MouseWheel>", _on_mousewheel))
+    scroll_area.bind("<Leave>", lambda _e: scroll_canvas.unbind_all("<MouseWheel>"))
 
     status_text = tk.StringVar(value="")
     status_label = tk.Label(
         content,
         textvariable=status_text,
-        bg=APP_BG,
-        fg=TEXT_MUTED,
+        bg=_APP_BG,
+        fg=_TEXT_MUTED,
         anchor="w",
         justify="left",
-        font=(FONT, 9),
+        font=FONTS["label"],
         wraplength=760,
     )
     status_label.grid(row=0, column=0, sticky="ew", pady=(0, 12))
@@ -694,52 +880,58 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
     preview_card, preview_body = make_card(content, "Preview")
     preview_card.grid(row=4, column=0, sticky="ew", pady=(12, 0))
 
-    url_entry = add_field(nav_body, 0, 0, "Navidrome URL", url_var, colspan=2)
-    add_field(nav_body, 1, 0, "Username", user_var)
-    add_field(nav_body, 1, 1, "Password", pass_var, show="*")
-    add_field(nav_body, 2, 0, "Client name", client_var)
+    url_entry = add_field(nav_body, 0, 0, "Navidrome URL", tkvars["url"], colspan=2)
+    add_field(nav_body, 1, 0, "Username", tkvars["user"])
+    add_field(nav_body, 1, 1, "Password", tkvars["pass"], show="*")
+    add_field(nav_body, 2, 0, "Client name", tkvars["client"])
+
+    # Mirrors whether status_text is empty so per-keystroke clears avoid a Tcl read;
+    # "clear_id" is the pending after_idle clear, if any; "fg" is the label's
+    # current color so repeated messages of one kind skip the configure call.
+    status_state: dict[str, object] = {"empty": True, "clear_id": None, "fg": _TEXT_MUTED}
+    status_colors = {"ok": _SUCCESS, "error": _ERROR, "working": _PRIMARY}
 
     def set_status(message: str, *, kind: str = "info") -> None:
+        clear_id = status_state["clear_id"]
+        if clear_id is not None:
+            # A newer message wins over a clear queued by earlier edits.
+            root.after_cancel(clear_id)
+            status_state["clear_id"] = None
         status_text.set(message)
-        if kind == "ok":
-            status_label.configure(fg=SUCCESS)
-        elif kind == "error":
-            status_label.configure(fg=ERROR)
-        elif kind == "working":
-            status_label.configure(fg=PRIMARY)
-        else:
-            status_label.configure(fg=TEXT_MUTED)
+        status_state["empty"] = not message
+        fg = status_colors.get(kind, _TEXT_MUTED)
+        if fg != status_state["fg"]:
+            status_label.configure(fg=fg)
+            status_state["fg"] = fg
+
+    def _flush_clear_status() -> None:
+        status_state["clear_id"] = None
+        set_status("")
 
     def clear_status(*_args: object) -> None:
-        if status_text.get():
-            set_status("")
-
-    for var in (
-        url_var,
-        user_var,
-        pass_var,
-        client_var,
-        version_var,
-        timeout_var,
-        host_var,
-        port_var,
-        refresh_var,
-        placeholder_value_var,
-        placeholder_label_var,
-        expand_width_var,
-        theme_font_var,
-        theme_font_preset_var,
-        theme_text_color_var,
-        theme_card_bg_var,
-        theme_card_radius_var,
-        theme_accent_start_var,
-        theme_accent_end_var,
-        theme_cover_size_var,
-        theme_min_width_var,
-        theme_title_size_var,
-        theme_artist_size_var,
-    ):
-        var.trace_add("write", clear_status)
+        # Bursts of writes (typing, pasting, preset changes) share one idle-time clear.
+        if status_state["empty"] or status_state["clear_id"] is not None:
+            return
+        status_state["clear_id"] = root.after_idle(_flush_clear_status)
+
+    # Entry text as of focus-in or the last check, keyed by widget path. Comparing
+    # against it clears the status only on real edits (not navigation, Ctrl+A/C, ...).
+    entry_text: dict[str, str] = {}
+
+    def _remember_entry_text(event: tk.Event) -> None:
+        entry_text[str(event.widget)] = event.widget.get()
+
+    def _clear_status_on_edit(event: tk.Event) -> None:
+        key = str(event.widget)
+        text = event.widget.get()
+        if entry_text.get(key) != text:
+            entry_text[key] = text
+            clear_status()
+
+    root.bind_class(CLEAR_STATUS_TAG, "<FocusIn>", _remember_entry_text)
+    # ButtonRelease covers middle-click paste, which sends no key events.
+    root.bind_class(CLEAR_STATUS_TAG, "<KeyRelease>", _clear_status_on_edit)
+    root.bind_class(CLEAR_STATUS_TAG, "<ButtonRelease>", _clear_status_on_edit)
 
     def _parse_int(raw: str, default: int) -> int:
         try:
@@ -747,75 +939,61 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         except ValueError:
             return default
 
-    def _css_color_to_tk(raw: str, default: str) -> str:
-        """Convert a CSS-ish color to something Tk can use (best-effort)."""
-
-        value = (raw or "").strip()
-        if not value:
-            return default
-        if value.startswith("#"):
-            return value
-        if value.lower().startswith("rgb(") and value.endswith(")"):
-            try:
-                inner = value[4:-1]
-                parts = [p.strip() for p in inner.split(",")]
-                if len(parts) >= 3:
-                    r, g, b = (int(float(parts[0])), int(float(parts[1])), int(float(parts[2])))
-                    return f"#{r:02x}{g:02x}{b:02x}"
-            except Exception:  # pylint: disable=broad-except
-                return default
-        if value.lower().startswith("rgba(") and value.endswith(")"):
-            try:
-                inner = value[5:-1]
-                parts = [p.strip() for p in inner.split(",")]
-                if len(parts) >= 3:
-                    r, g, b = (int(float(parts[0])), int(float(parts[1])), int(float(parts[2])))
-                    return f"#{r:02x}{g:02x}{b:02x}"
-            except Exception:  # pylint: disable=broad-except
-                return default
-
-        # Named colors might work; otherwise, fall back.
-        return value
-
     def _first_font_family(css_font_family: str) -> str:
         raw = (css_font_family or "").strip()
         if not raw:
-            return FONT
+            return _FONT
         first = raw.split(",", 1)[0].strip().strip('"').strip("'")
-        return first or FONT
+        return first or _FONT
+
+    # Named Tk fonts are per interpreter, so the cache lives as long as this root.
+    preview_fonts: dict[tuple[str, int, str], object] = {}
+
+    def _get_font(family: str, size: int, weight: str = "normal") -> object:
+        key = (family, size, weight)
+        font = preview_fonts.get(key)
+        if font is None:
+            try:
+                font = tkfont.Font(family=family, size=size, weight=weight)
+            except tk.TclError:
+                return (_FONT, size, weight)
+            preview_fonts[key] = font
+        return font
 
     # --- Preview (in-page, best-effort to match overlay layout) ---
-    preview_surface = tk.Frame(preview_body, bg=APP_BG)
+    preview_surface = tk.Frame(preview_body, bg=_APP_BG)
     preview_surface.grid(row=0, column=0, sticky="ew")
     preview_surface.columnconfigure(0, weight=1)
 
     tk.Label(
         preview_surface,
         text="Preview",
-        bg=APP_BG,
-        fg=TEXT,
-        font=(FONT, 10, "bold"),
+        bg=_APP_BG,
+        fg=_TEXT,
+        font=FONTS["title"],
         anchor="w",
     ).grid(row=0, column=0, sticky="w", pady=(0, 6))
 
-    preview_canvas = tk.Canvas(preview_surface, bg=APP_BG, highlightthickness=0, bd=0, height=240)
+    preview_canvas = tk.Canvas(preview_surface, bg=_APP_BG, highlightthickness=0, bd=0, height=240)
     preview_canvas.grid(row=1, column=0, sticky="ew")
 
     # Default to "Nothing playing" so the placeholder (dark/light/off) choice is visible immediately.
     preview_state_var = tk.StringVar(value="Nothing playing")
-    preview_controls = tk.Frame(preview_surface, bg=APP_BG)
+    preview_controls = tk.Frame(preview_surface, bg=_APP_BG)
     preview_controls.grid(row=2, column=0, sticky="ew", pady=(8, 0))
-    tk.Label(preview_controls, text="State", bg=APP_BG, fg=TEXT_MUTED, anchor="w").grid(
+    tk.Label(preview_controls, text="State", bg=_APP_BG, fg=_TEXT_MUTED, anchor="w").grid(
         row=0, column=0, sticky="w", padx=(0, 8)
     )
     state_menu = tk.OptionMenu(preview_controls, preview_state_var, "Playing", "Nothing playing")
-    state_menu.configure(bg=SURFACE, fg=TEXT, activebackground=SURFACE, activeforeground=TEXT)
+    state_menu.configure(bg=_SURFACE, fg=_TEXT, activebackground=_SURFACE, activeforeground=_TEXT)
     state_menu.grid(row=0, column=1, sticky="w")
 
     placeholder_preview_state: dict[str, object] = {
         "raw": {},
+        "raw_dims": {},
         "scaled": {},
         "last": None,
+        "last_key": None,
     }
 
     def _get_placeholder_image(variant: str, size_px: int) -> Optional[tk.PhotoImage]:
@@ -825,17 +1003,20 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         assets_dir = Path(__file__).with_name("assets")
         filename = "Nothing Playing Dark.png" if variant == "dark" else "Nothing Playing Light.png"
         path = assets_dir / filename
-        if not path.exists():
-            return None
 
         raw_cache: dict[str, tk.PhotoImage] = placeholder_preview_state["raw"]  # type: ignore[assignment]
+        raw_dims: dict[str, tuple[int, int]] = placeholder_preview_state["raw_dims"]  # type: ignore[assignment]
         scaled_cache: dict[tuple[str, int], tk.PhotoImage] = placeholder_preview_state["scaled"]  # type: ignore[assignment]
 
         if variant not in raw_cache:
             try:
-                raw_cache[variant] = tk.PhotoImage(file=str(path))
-            except Exception:  # pylint: disable=broad-except
+                loaded = tk.PhotoImage(file=str(path))
+            except (tk.TclError, OSError):
+                # Missing or unreadable asset.
                 return None
+            raw_cache[variant] = loaded
+            # width()/height() are Tcl round-trips; read them once per image.
+            raw_dims[variant] = (max(1, loaded.width()), max(1, loaded.height()))
 
         raw_img = raw_cache[variant]
         key = (variant, int(size_px))
@@ -843,158 +1024,162 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
             return scaled_cache[key]
 
         # Best-effort scaling using integer zoom/subsample.
-        w = max(1, raw_img.width())
-        h = max(1, raw_img.height())
+        w, h = raw_dims[variant]
         target = max(16, int(size_px))
 
         subsample_factor = max(1, int(round(max(w, h) / target)))
-        img = raw_img.subsample(subsample_factor, subsample_factor) if subsample_factor > 1 else raw_img
-
-        w2 = max(1, img.width())
-        h2 = max(1, img.height())
+        # Tk rounds subsampled dimensions up, so derive them without asking Tk.
+        w2 = -(-w // subsample_factor)
+        h2 = -(-h // subsample_factor)
         zoom_factor = max(1, int(target / max(w2, h2)))
-        if zoom_factor > 1:
-            img = img.zoom(zoom_factor, zoom_factor)
 
+        if subsample_factor == 1 and zoom_factor == 1:
+            img = raw_img
+        else:
+            img = raw_img.subsample(subsample_factor, subsample_factor) if subsample_factor > 1 else raw_img
+            if zoom_factor > 1:
+                img = img.zoom(zoom_factor, zoom_factor)
+
+        # Bounded, oldest-first eviction; the displayed image is also held by "last".
+        if len(scaled_cache) >= _PLACEHOLDER_SCALED_CACHE_SIZE:
+            del scaled_cache[next(iter(scaled_cache))]
         scaled_cache[key] = img
         return img
 
-    def _hex_to_rgb(value: str) -> Optional[tuple[int, int, int]]:
-        v = (value or "").strip()
-        if not v.startswith("#"):
-            return None
-        h = v[1:]
-        if len(h) == 3:
-            try:
-                r = int(h[0] * 2, 16)
-                g = int(h[1] * 2, 16)
-                b = int(h[2] * 2, 16)
-                return (r, g, b)
-            except ValueError:
-                return None
-        if len(h) == 6:
-            try:
-                r = int(h[0:2], 16)
-                g = int(h[2:4], 16)
-                b = int(h[4:6], 16)
-                return (r, g, b)
-            except ValueError:
-                return None
-        return None
-
-    def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-        r, g, b = rgb
-        return f"#{max(0, min(255, r)):02x}{max(0, min(255, g)):02x}{max(0, min(255, b)):02x}"
+    def _round_rect_points(x1: int, y1: int, x2: int, y2: int, r: int) -> list[int]:
+        template = _round_rect_template(x2 - x1, y2 - y1, int(r))
+        return [v + (y1 if i & 1 else x1) for i, v in enumerate(template)]
+
+    # Long-lived preview canvas items by tag; redraws move/restyle them instead of
+    # deleting and recreating everything.
+    preview_items: dict[str, int] = {}
+    # Bound canvas methods resolved once instead of per item per redraw.
+    canvas_create: dict[str, Callable[..., int]] = {
+        "polygon": preview_canvas.create_polygon,
+        "text": preview_canvas.create_text,
+        "image": preview_canvas.create_image,
+    }
+    canvas_coords = preview_canvas.coords
+    canvas_itemconfigure = preview_canvas.itemconfigure
+
+    def _place_item(tag: str, kind: str, coords: list[int], **options: object) -> int:
+        item = preview_items.get(tag)
+        if item is None:
+            item = canvas_create[kind](coords, tags=(tag,), **options)
+            preview_items[tag] = item
+        else:
+            canvas_coords(item, coords)
+            canvas_itemconfigure(item, **options)
+        return item
 
-    def _blend(bg: tuple[int, int, int], fg: tuple[int, int, int], alpha: float) -> tuple[int, int, int]:
-        a = max(0.0, min(1.0, float(alpha)))
-        return (
-            int(bg[0] + (fg[0] - bg[0]) * a),
-            int(bg[1] + (fg[1] - bg[1]) * a),
-            int(bg[2] + (fg[2] - bg[2]) * a),
+    def _place_round_rect(
+        tag: str, x1: int, y1: int, x2: int, y2: int, r: int, *, fill: str, **options: object
+    ) -> int:
+        return _place_item(
+            tag,
+            "polygon",
+            _round_rect_points(x1, y1, x2, y2, r),
+            fill=fill,
+            outline="",
+            **options,
         )
 
-    def _create_round_rect(x1: int, y1: int, x2: int, y2: int, r: int, *, fill: str) -> int:
-        rr = max(0, int(r))
-        rr = min(rr, int((x2 - x1) / 2), int((y2 - y1) / 2))
-        points = [
-            x1 + rr,
-            y1,
-            x2 - rr,
-            y1,
-            x2,
-            y1,
-            x2,
-            y1 + rr,
-            x2,
-            y2 - rr,
-            x2,
-            y2,
-            x2 - rr,
-            y2,
-            x1 + rr,
-            y2,
-            x1,
-            y2,
-            x1,
-            y2 - rr,
-            x1,
-            y1 + rr,
-            x1,
-            y1,
-        ]
-        return preview_canvas.create_polygon(points, smooth=True, splinesteps=36, fill=fill, outline="")
+    def _hide_item(tag: str) -> None:
+        item = preview_items.get(tag)
+        if item is not None:
+            canvas_itemconfigure(item, state="hidden")
+
+    # Preview inputs that only come from the .env snapshot (no GUI field); read once.
+    try:
+        static_muted_opacity = float(existing.get("OVERLAY_THEME_MUTED_OPACITY", "0.8") or "0.8")
+    except ValueError:
+        static_muted_opacity = 0.8
+    static_cfg = SimpleNamespace(
+        card_gap=_env_int(existing, "OVERLAY_THEME_CARD_GAP_PX", 16),
+        pad_x=_env_int(existing, "OVERLAY_THEME_CARD_PADDING_X_PX", 20),
+        pad_y=_env_int(existing, "OVERLAY_THEME_CARD_PADDING_Y_PX", 16),
+        cover_radius=_env_int(existing, "OVERLAY_THEME_COVER_RADIUS_PX", 12),
+        muted_opacity=static_muted_opacity,
+    )
+
+    preview_vars: tuple[tk.Variable, ...] = (
+        preview_state_var,
+        placeholder_value_var,
+        expand_width_var,
+        # Accent colors are not drawn by the preview (or the overlay), so editing
+        # them must not trigger a redraw.
+        tkvars["theme_font"],
+        tkvars["theme_text_color"],
+        tkvars["theme_card_bg"],
+        tkvars["theme_card_radius"],
+        tkvars["theme_cover_size"],
+        tkvars["theme_min_width"],
+        tkvars["theme_title_size"],
+        tkvars["theme_artist_size"],
+    )
 
     _preview_after_id: Optional[str] = None
+    # Values the canvas currently shows; lets traces/<Configure> bursts skip no-op redraws.
+    _preview_snapshot: tuple[object, ...] = ()
+    # Set when a redraw was skipped because the preview canvas wasn't mapped yet.
+    _preview_dirty = False
 
     def _schedule_preview_redraw(*_args: object) -> None:
         nonlocal _preview_after_id
         if _preview_after_id is not None:
-            try:
-                root.after_cancel(_preview_after_id)
-            except Exception:  # pylint: disable=broad-except
-                pass
-        _preview_after_id = root.after(50, _redraw_preview)
+            # A redraw is already queued and reads the latest values when it runs, so
+            # chained writes (preset -> value var) and typing bursts coalesce into it.
+            return
+        if tuple(var.get() for var in preview_vars) == _preview_snapshot:
+            return
+        _preview_after_id = root.after(120, _redraw_preview)
 
     def _redraw_preview() -> None:
-        nonlocal _preview_after_id
+        nonlocal _preview_after_id, _preview_snapshot, _preview_dirty
         _preview_after_id = None
-
-        preview_canvas.delete("all")
+        if not preview_canvas.winfo_ismapped():
+            # Nothing is visible yet (e.g. while the window is still being built).
+            _preview_dirty = True
+            return
+        _preview_dirty = False
+
+        # Every Tk variable is read exactly once, here (each get() is a Tcl call).
+        _preview_snapshot = tuple(var.get() for var in preview_vars)
+        (
+            state_raw,
+            placeholder_raw,
+            _expand_width,
+            css_font_raw,
+            text_color_raw,
+            card_bg_raw,
+            card_radius_raw,
+            cover_size_raw,
+            min_width_raw,
+            title_size_raw,
+            artist_size_raw,
+        ) = _preview_snapshot
 
         # Read theme values (defaults aligned with overlay_html.py)
-        css_font = theme_font_var.get() or '"Segoe UI", sans-serif'
+        css_font = css_font_raw or '"Segoe UI", sans-serif'
         font_family = _first_font_family(css_font)
-        text_color_hex = _css_color_to_tk(theme_text_color_var.get(), "#f4f4f5")
-        card_bg_raw = theme_card_bg_var.get() or "rgba(10, 10, 10, 0.75)"
-
-        card_radius = _parse_int(theme_card_radius_var.get(), 14)
-        card_gap = _parse_int(existing.get("OVERLAY_THEME_CARD_GAP_PX", "16"), 16)
-        pad_x = _parse_int(existing.get("OVERLAY_THEME_CARD_PADDING_X_PX", "20"), 20)
-        pad_y = _parse_int(existing.get("OVERLAY_THEME_CARD_PADDING_Y_PX", "16"), 16)
-        cover_size = _parse_int(theme_cover_size_var.get(), 96)
-        cover_radius = _parse_int(existing.get("OVERLAY_THEME_COVER_RADIUS_PX", "12"), 12)
-        min_width = _parse_int(theme_min_width_var.get(), 320)
-        title_size = _parse_int(theme_title_size_var.get(), 18)
-        artist_size = _parse_int(theme_artist_size_var.get(), 14)
-        muted_opacity = float(existing.get("OVERLAY_THEME_MUTED_OPACITY", "0.8") or "0.8")
-
-        # Tk can't do true alpha like CSS; approximate by dropping alpha and blending against a dark "preview background".
-        preview_bg_rgb = _hex_to_rgb("#0b0b0b") or (11, 11, 11)
-
-        def _rgba_to_rgb_approx(css: str, fallback: tuple[int, int, int]) -> tuple[int, int, int]:
-            v = (css or "").strip().lower()
-            if v.startswith("rgba(") and v.endswith(")"):
-                try:
-                    inner = v[5:-1]
-                    parts = [p.strip() for p in inner.split(",")]
-                    if len(parts) >= 4:
-                        r = int(float(parts[0]))
-                        g = int(float(parts[1]))
-                        b = int(float(parts[2]))
-                        a = float(parts[3])
-                        return _blend(preview_bg_rgb, (r, g, b), a)
-                except Exception:  # pylint: disable=broad-except
-                    return fallback
-            if v.startswith("rgb(") and v.endswith(")"):
-                try:
-                    inner = v[4:-1]
-                    parts = [p.strip() for p in inner.split(",")]
-                    if len(parts) >= 3:
-                        r = int(float(parts[0]))
-                        g = int(float(parts[1]))
-                        b = int(float(parts[2]))
-                        return (r, g, b)
-                except Exception:  # pylint: disable=broad-except
-                    return fallback
-
-            rgb = _hex_to_rgb(_css_color_to_tk(css, _rgb_to_hex(fallback)))
-            return rgb or fallback
-
-        card_bg_rgb = _rgba_to_rgb_approx(card_bg_raw, (10, 10, 10))
+        text_color_hex = _css_color_to_tk(text_color_raw, "#f4f4f5")
+        card_bg_raw = card_bg_raw or "rgba(10, 10, 10, 0.75)"
+
+        card_radius = _parse_int(card_radius_raw, 14)
+        card_gap = static_cfg.card_gap
+        pad_x = static_cfg.pad_x
+        pad_y = static_cfg.pad_y
+        cover_size = _parse_int(cover_size_raw, 96)
+        cover_radius = static_cfg.cover_radius
+        min_width = _parse_int(min_width_raw, 320)
+        title_size = _parse_int(title_size_raw, 18)
+        artist_size = _parse_int(artist_size_raw, 14)
+        muted_opacity = static_cfg.muted_opacity
+
+        card_bg_rgb = _rgba_to_rgb_approx(card_bg_raw, _CARD_BG_DEFAULT_RGB, _PREVIEW_BG_RGB)
         card_bg_hex = _rgb_to_hex(card_bg_rgb)
 
-        text_rgb = _hex_to_rgb(_css_color_to_tk(text_color_hex, "#f4f4f5")) or (244, 244, 245)
+        text_rgb = _hex_to_rgb(_css_color_to_tk(text_color_hex, "#f4f4f5")) or _TEXT_DEFAULT_RGB
         artist_rgb = _blend(card_bg_rgb, text_rgb, muted_opacity)
 
         # Layout (mirrors overlay CSS)
@@ -1015,142 +1200,242 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         y2 = y1 + card_h
 
         # Soft shadow approximation
-        shadow1 = _create_round_rect(x1 + 6, y1 + 10, x2 + 6, y2 + 10, card_radius, fill="#000000")
-        preview_canvas.itemconfigure(shadow1, stipple="gray50")
-        shadow2 = _create_round_rect(x1 + 2, y1 + 4, x2 + 2, y2 + 4, card_radius, fill="#000000")
-        preview_canvas.itemconfigure(shadow2, stipple="gray25")
+        _place_round_rect(
+            "shadow1", x1 + 6, y1 + 10, x2 + 6, y2 + 10, card_radius, fill="#000000", stipple="gray50"
+        )
+        _place_round_rect(
+            "shadow2", x1 + 2, y1 + 4, x2 + 2, y2 + 4, card_radius, fill="#000000", stipple="gray25"
+        )
 
-        _create_round_rect(x1, y1, x2, y2, card_radius, fill=card_bg_hex)
+        _place_round_rect("card", x1, y1, x2, y2, card_radius, fill=card_bg_hex)
 
         cover_x1 = x1 + pad_x
         cover_y1 = y1 + pad_y
         cover_x2 = cover_x1 + cover_size
         cover_y2 = cover_y1 + cover_size
 
-        cover_bg_rgb = _blend(card_bg_rgb, (255, 255, 255), 0.08)
-        _create_round_rect(cover_x1, cover_y1, cover_x2, cover_y2, cover_radius, fill=_rgb_to_hex(cover_bg_rgb))
+        cover_bg_rgb = _blend8(card_bg_rgb, (255, 255, 255), 20)  # 8% white
+        _place_round_rect(
+            "cover_bg", cover_x1, cover_y1, cover_x2, cover_y2, cover_radius, fill=_rgb_to_hex(cover_bg_rgb)
+        )
 
         # Determine cover content
-        state = (preview_state_var.get() or "Playing").strip().lower()
-        placeholder_variant = (placeholder_value_var.get() or "dark").strip().lower()
+        state = (state_raw or "Playing").strip().lower()
+        nothing_playing = state.startswith("nothing")
+        placeholder_variant = (placeholder_raw or "dark").strip().lower()
         if placeholder_variant in {"off", "none", "false", "0"}:
             placeholder_variant = "off"
-        use_placeholder = state.startswith("nothing")
+        use_placeholder = nothing_playing
 
         img: Optional[tk.PhotoImage] = None
+        placeholder_key: Optional[tuple[str, int]] = None
         if use_placeholder and placeholder_variant in {"dark", "light"}:
-            img = _get_placeholder_image(placeholder_variant, cover_size)
+            placeholder_key = (placeholder_variant, cover_size)
+            if placeholder_preview_state["last_key"] == placeholder_key:
+                img = placeholder_preview_state["last"]  # type: ignore[assignment]
+            else:
+                img = _get_placeholder_image(placeholder_variant, cover_size)
 
         cx = int((cover_x1 + cover_x2) / 2)
         cy = int((cover_y1 + cover_y2) / 2)
         if img is not None:
-            preview_canvas.create_image(cx, cy, image=img)
+            _place_item("cover_img", "image", [cx, cy], image=img, state="normal")
             placeholder_preview_state["last"] = img
+            placeholder_preview_state["last_key"] = placeholder_key
+            _hide_item("cover_note")
         else:
-            note_rgb = _blend(card_bg_rgb, text_rgb, 0.6)
-            try:
-                note_font = tkfont.Font(family=font_family, size=max(14, cover_size // 3), weight="bold")
-            except Exception:  # pylint: disable=broad-except
-                note_font = (FONT, max(14, cover_size // 3), "bold")
-            preview_canvas.create_text(cx, cy, text="♪", fill=_rgb_to_hex(note_rgb), font=note_font)
+            note_rgb = _blend8(card_bg_rgb, text_rgb, 153)  # 60% text
+            note_font = _get_font(font_family, max(14, cover_size // 3), "bold")
+            _place_item(
+                "cover_note",
+                "text",
+                [cx, cy],
+                text="♪",
+                fill=_rgb_to_hex(note_rgb),
+                font=note_font,
+                state="normal",
+            )
+            _hide_item("cover_img")
 
         # Text
         text_x = cover_x2 + card_gap
         title_y = cover_y1
         artist_y = title_y + title_size + title_artist_gap
 
-        title_text = "Song Title" if not state.startswith("nothing") else "Nothing playing"
-        artist_text = "Artist Name" if not state.startswith("nothing") else ""
+        title_text = "Song Title" if not nothing_playing else "Nothing playing"
+        artist_text = "Artist Name" if not nothing_playing else ""
 
-        try:
-            title_font = tkfont.Font(family=font_family, size=title_size, weight="bold")
-            artist_font = tkfont.Font(family=font_family, size=artist_size)
-        except Exception:  # pylint: disable=broad-except
-            title_font = (FONT, title_size, "bold")
-            artist_font = (FONT, artist_size)
+        title_font = _get_font(font_family, title_size, "bold")
+        artist_font = _get_font(font_family, artist_size)
 
-        preview_canvas.create_text(text_x, title_y, anchor="nw", text=title_text, fill=_rgb_to_hex(text_rgb), font=title_font)
+        _place_item(
+            "title",
+            "text",
+            [text_x, title_y],
+            anchor="nw",
+            text=title_text,
+            fill=_rgb_to_hex(text_rgb),
+            font=title_font,
+        )
         if artist_text:
-            preview_canvas.create_text(text_x, artist_y, anchor="nw", text=artist_text, fill=_rgb_to_hex(artist_rgb), font=artist_font)
+            _place_item(
+                "artist",
+                "text",
+                [text_x, artist_y],
+                anchor="nw",
+                text=artist_text,
+                fill=_rgb_to_hex(artist_rgb),
+                font=artist_font,
+                state="normal",
+            )
+        else:
+            _hide_item("artist")
 
-    for var in (
-        preview_state_var,
-        placeholder_value_var,
-        expand_width_var,
-        theme_font_var,
-        theme_text_color_var,
-        theme_card_bg_var,
-        theme_card_radius_var,
-        theme_accent_start_var,
-        theme_accent_end_var,
-        theme_cover_size_var,
-        theme_min_width_var,
-        theme_title_size_var,
-        theme_artist_size_var,
-    ):
+    for var in preview_vars:
         var.trace_add("write", _schedule_preview_redraw)
-    expand_width_var.trace_add("write", _schedule_preview_redraw)
     preview_canvas.bind("<Configure>", _schedule_preview_redraw)
+
+    def _on_preview_map(_event: object) -> None:
+        nonlocal _preview_after_id
+        if not _preview_dirty:
+            return
+        if _preview_after_id is not None:
+            # Draw now instead of also letting the queued redraw run afterwards.
+            root.after_cancel(_preview_after_id)
+            _preview_after_id = None
+        _redraw_preview()
+
+    preview_canvas.bind("<Map>", _on_preview_map)
     _schedule_preview_redraw()
 
+    def post_to_ui(callback: Callable[[], None]) -> None:
+        """Run callback on the Tk main loop (safe to call from worker threads)."""
+
+        try:
+            root.after(0, callback)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while the request was in flight.
+
+    # Network actions currently in flight (by name); guards against double clicks.
+    busy: dict[str, bool] = {}
+
+    def run_in_background(
+        action: str,
+        button: tk.Button,
+        work: Callable[[], object],
+        on_success: Callable[[object], None],
+        error_prefix: str,
+    ) -> None:
+        """Run work() on a daemon thread, reporting back on the Tk main loop."""
+
+        busy[action] = True
+        button.configure(state="disabled")
+
+        def finish(report: Callable[[], None]) -> None:
+            busy[action] = False
+            button.configure(state="normal")
+            report()
+
+        def worker() -> None:
+            try:
+                result = work()
+            except Exception as exc:  # pylint: disable=broad-except
+                message = f"{error_prefix}: {type(exc).__name__}: {exc}"
+                post_to_ui(lambda: finish(lambda: set_status(message, kind="error")))
+                return
+            post_to_ui(lambda: finish(lambda: on_success(result)))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _norm_url(var: tk.StringVar) -> str:
+        return var.get().strip().rstrip("/")
+
+    # Parsed numeric fields keyed by tkvars name: (raw text, int or None if invalid).
+    # Detect, Test connection and Save reuse the parse until the text changes.
+    parsed_ints: dict[str, tuple[str, Optional[int]]] = {}
+
+    def _field_int(name: str, default: str) -> int:
+        raw = tkvars[name].get().strip() or default
+        cached = parsed_ints.get(name)
+        if cached is None or cached[0] != raw:
+            try:
+                cached = (raw, _to_int(raw))
+            except ValueError:
+                cached = (raw, None)
+            parsed_ints[name] = cached
+        if cached[1] is None:
+            raise ValueError(raw)
+        return cached[1]
+
     def on_detect_api_version() -> None:
-        url = url_var.get().strip().rstrip("/")
-        if not (url.startswith("http://") or url.startswith("https://")):
+        if busy.get("detect"):
+            return
+        url = _norm_url(tkvars["url"])
+        if not url.startswith(_HTTP_SCHEMES):
             set_status("Navidrome URL must start with http:// or https://", kind="error")
             return
-        if not user_var.get().strip():
+        if not tkvars["user"].get().strip():
             set_status("Username is required", kind="error")
             return
-        if not pass_var.get().strip():
+        if not tkvars["pass"].get().strip():
             set_status("Password is required", kind="error")
             return
         try:
-            timeout_i = int(float(timeout_var.get().strip() or "6"))
+            timeout_i = _field_int("timeout", "6")
         except ValueError:
             set_status("Timeout must be a number", kind="error")
             return
 
+        from navidrome_api import detect_subsonic_api_version
+
         set_status("Detecting API version…", kind="working")
-        root.update_idletasks()
-        try:
-            detected = detect_subsonic_api_version(
+        # Read the Tk variables here; the worker thread must not touch them.
+        user = tkvars["user"].get().strip()
+        password = tkvars["pass"].get().strip()
+        client = tkvars["client"].get().strip() or "obs-overlay"
+
+        def apply_detected(detected: object) -> None:
+            tkvars["version"].set(str(detected))
+            set_status(f"Detected API version: {detected}", kind="ok")
+
+        run_in_background(
+            "detect",
+            detect_button,
+            lambda: detect_subsonic_api_version(
                 navidrome_url=url,
-                navidrome_user=user_var.get().strip(),
-                navidrome_password=pass_var.get().strip(),
-                navidrome_client=(client_var.get().strip() or "obs-overlay"),
+                navidrome_user=user,
+                navidrome_password=password,
+                navidrome_client=client,
                 timeout=float(timeout_i),
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            set_status(f"Detect failed: {type(exc).__name__}: {exc}", kind="error")
-            return
-
-        version_var.set(detected)
-        set_status(f"Detected API version: {detected}", kind="ok")
+            ),
+            apply_detected,
+            "Detect failed",
+        )
 
     # API version field + inline Detect button
-    add_field_with_button(
+    _version_entry, detect_button = add_field_with_button(
         nav_body,
         2,
         1,
         "API version",
-        version_var,
+        tkvars["version"],
         button_text="Detect",
         command=on_detect_api_version,
     )
 
-    add_field(nav_body, 3, 0, "Timeout (sec)", timeout_var, colspan=2)
+    add_field(nav_body, 3, 0, "Timeout (sec)", tkvars["timeout"], colspan=2)
     tk.Label(
         nav_body,
         text="Tip: URL is usually http://localhost:4533 (or your server IP).",
-        bg=SURFACE,
-        fg=TEXT_MUTED,
-        font=(FONT, 9),
+        bg=_SURFACE,
+        fg=_TEXT_MUTED,
+        font=FONTS["label"],
         anchor="w",
     ).grid(row=8, column=0, columnspan=2, sticky="w")
 
-    add_field(overlay_body, 0, 0, "Overlay host", host_var)
-    add_field(overlay_body, 0, 1, "Overlay port", port_var)
-    add_field(overlay_body, 1, 0, "Refresh (sec)", refresh_var)
+    add_field(overlay_body, 0, 0, "Overlay host", tkvars["host"])
+    add_field(overlay_body, 0, 1, "Overlay port", tkvars["port"])
+    add_field(overlay_body, 1, 0, "Refresh (sec)", tkvars["refresh"])
 
     def on_placeholder_label_change(*_args: object) -> None:
         label = placeholder_label_var.get()
@@ -1172,12 +1457,13 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         overlay_body,
         text="Allow overlay to expand wider to fit long titles/artists",
         variable=expand_width_var,
-        bg=SURFACE,
-        fg=TEXT,
-        activebackground=SURFACE,
-        activeforeground=TEXT,
-        selectcolor=SURFACE,
-        font=(FONT, 10),
+        command=clear_status,
+        bg=_SURFACE,
+        fg=_TEXT,
+        activebackground=_SURFACE,
+        activeforeground=_TEXT,
+        selectcolor=_SURFACE,
+        font=FONTS["body"],
         cursor="hand2",
     )
     expand_width_checkbox.grid(row=5, column=0, columnspan=2, sticky="w", pady=(0, 0))
@@ -1185,7 +1471,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
     def on_font_preset_change(*_args: object) -> None:
         label = theme_font_preset_var.get()
         if label in FONT_PRESETS:
-            theme_font_var.set(FONT_PRESETS[label])
+            tkvars["theme_font"].set(FONT_PRESETS[label])
 
     theme_font_preset_var.trace_add("write", on_font_preset_change)
 
@@ -1197,51 +1483,69 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         theme_font_preset_var,
         options=list(FONT_PRESETS.keys()) + ["Custom…"],
     )
-    add_field(theme_body, 0, 1, "Font family (CSS)", theme_font_var)
+    add_field(theme_body, 0, 1, "Font family (CSS)", tkvars["theme_font"])
 
-    text_color_entry = add_field(theme_body, 1, 0, "Text color", theme_text_color_var)
-    enable_color_picker_on_click(text_color_entry, theme_text_color_var)
+    text_color_entry = add_field(theme_body, 1, 0, "Text color", tkvars["theme_text_color"])
+    enable_color_picker_on_click(text_color_entry, tkvars["theme_text_color"])
 
-    card_bg_entry = add_field(theme_body, 1, 1, "Card background", theme_card_bg_var)
+    card_bg_entry = add_field(theme_body, 1, 1, "Card background", tkvars["theme_card_bg"])
     enable_color_picker_on_click(
         card_bg_entry,
-        theme_card_bg_var,
-        prefer_rgba_alpha_from=theme_card_bg_var,
+        tkvars["theme_card_bg"],
+        prefer_rgba_alpha_from=tkvars["theme_card_bg"],
     )
 
-    accent_start_entry = add_field(theme_body, 2, 0, "Accent start", theme_accent_start_var)
-    enable_color_picker_on_click(accent_start_entry, theme_accent_start_var)
+    accent_start_entry = add_field(theme_body, 2, 0, "Accent start", tkvars["theme_accent_start"])
+    enable_color_picker_on_click(accent_start_entry, tkvars["theme_accent_start"])
 
-    accent_end_entry = add_field(theme_body, 2, 1, "Accent end", theme_accent_end_var)
-    enable_color_picker_on_click(accent_end_entry, theme_accent_end_var)
+    accent_end_entry = add_field(theme_body, 2, 1, "Accent end", tkvars["theme_accent_end"])
+    enable_color_picker_on_click(accent_end_entry, tkvars["theme_accent_end"])
 
-    add_field(theme_body, 3, 0, "Card radius (px)", theme_card_radius_var)
-    add_field(theme_body, 3, 1, "Cover size (px)", theme_cover_size_var)
-    add_field(theme_body, 4, 0, "Min width (px)", theme_min_width_var)
-    add_field(theme_body, 4, 1, "Title size (px)", theme_title_size_var)
-    add_field(theme_body, 5, 0, "Artist size (px)", theme_artist_size_var)
+    add_field(theme_body, 3, 0, "Card radius (px)", tkvars["theme_card_radius"])
+    add_field(theme_body, 3, 1, "Cover size (px)", tkvars["theme_cover_size"])
+    add_field(theme_body, 4, 0, "Min width (px)", tkvars["theme_min_width"])
+    add_field(theme_body, 4, 1, "Title size (px)", tkvars["theme_title_size"])
+    add_field(theme_body, 5, 0, "Artist size (px)", tkvars["theme_artist_size"])
 
     tk.Label(
         theme_body,
         text="Tip: Leave a field blank to remove it from .env (defaults apply).",
-        bg=SURFACE,
-        fg=TEXT_MUTED,
-        font=(FONT, 9),
+        bg=_SURFACE,
+        fg=_TEXT_MUTED,
+        font=FONTS["label"],
         anchor="w",
     ).grid(row=12, column=0, columnspan=2, sticky="w", pady=(4, 0))
 
+    # Last successful validation, keyed by the raw field values it was computed from
+    # (e.g. "Test connection" followed by "Save" validates once).
+    validated: dict[str, object] = {"snapshot": None, "values": None}
+
     def validate_inputs() -> tuple[Optional[str], Optional[dict[str, str]]]:
-        url = url_var.get().strip().rstrip("/")
-        if not (url.startswith("http://") or url.startswith("https://")):
+        snapshot = (
+            *(var.get() for var in tkvars.values()),
+            expand_width_var.get(),
+            placeholder_value_var.get(),
+        )
+        if snapshot == validated["snapshot"]:
+            return None, validated["values"]  # type: ignore[return-value]
+        err, values = _validate_inputs()
+        if values is not None:
+            validated["snapshot"] = snapshot
+            validated["values"] = values
+        return err, values
+
+    def _validate_inputs() -> tuple[Optional[str], Optional[dict[str, str]]]:
+        url = _norm_url(tkvars["url"])
+        if not url.startswith(_HTTP_SCHEMES):
             return "Navidrome URL must start with http:// or https://", None
-        if not user_var.get().strip():
+        if not tkvars["user"].get().strip():
             return "Username is required", None
-        if not pass_var.get().strip():
+        if not tkvars["pass"].get().strip():
             return "Password is required", None
         try:
-            timeout_i = int(float(timeout_var.get().strip() or "6"))
-            port_i = int(port_var.get().strip() or "8080")
-            refresh_i = int(refresh_var.get().strip() or "1")
+            timeout_i = _field_int("timeout", "6")
+            port_i = _field_int("port", "8080")
+            refresh_i = _field_int("refresh", "1")
         except ValueError:
             return "Timeout/Port/Refresh must be numbers", None
         if port_i < 1 or port_i > 65535:
@@ -1256,7 +1560,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
             if not cleaned:
                 return None, None
             try:
-                value = int(cleaned)
+                value = _to_int(cleaned)
             except ValueError:
                 return f"{field} must be a number", None
             if value < minimum or value > maximum:
@@ -1264,39 +1568,39 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
             return None, value
 
         err, card_radius_i = parse_optional_int(
-            theme_card_radius_var.get(), field="Card radius", minimum=0, maximum=128
+            tkvars["theme_card_radius"].get(), field="Card radius", minimum=0, maximum=128
         )
         if err:
             return err, None
         err, cover_size_i = parse_optional_int(
-            theme_cover_size_var.get(), field="Cover size", minimum=16, maximum=512
+            tkvars["theme_cover_size"].get(), field="Cover size", minimum=16, maximum=512
         )
         if err:
             return err, None
         err, min_width_i = parse_optional_int(
-            theme_min_width_var.get(), field="Min width", minimum=100, maximum=2000
+            tkvars["theme_min_width"].get(), field="Min width", minimum=100, maximum=2000
         )
         if err:
             return err, None
         err, title_size_i = parse_optional_int(
-            theme_title_size_var.get(), field="Title size", minimum=8, maximum=72
+            tkvars["theme_title_size"].get(), field="Title size", minimum=8, maximum=72
         )
         if err:
             return err, None
         err, artist_size_i = parse_optional_int(
-            theme_artist_size_var.get(), field="Artist size", minimum=8, maximum=72
+            tkvars["theme_artist_size"].get(), field="Artist size", minimum=8, maximum=72
         )
         if err:
             return err, None
 
         values: dict[str, str] = {
             "NAVIDROME_URL": url,
-            "NAVIDROME_USER": user_var.get().strip(),
-            "NAVIDROME_PASSWORD": pass_var.get().strip(),
-            "NAVIDROME_CLIENT_NAME": client_var.get().strip() or "obs-overlay",
-            "NAVIDROME_API_VERSION": version_var.get().strip() or "1.16.1",
+            "NAVIDROME_USER": tkvars["user"].get().strip(),
+            "NAVIDROME_PASSWORD": tkvars["pass"].get().strip(),
+            "NAVIDROME_CLIENT_NAME": tkvars["client"].get().strip() or "obs-overlay",
+            "NAVIDROME_API_VERSION": tkvars["version"].get().strip() or "1.16.1",
             "NAVIDROME_TIMEOUT": str(timeout_i),
-            "OVERLAY_HOST": host_var.get().strip() or "127.0.0.1",
+            "OVERLAY_HOST": tkvars["host"].get().strip() or "127.0.0.1",
             "OVERLAY_PORT": str(port_i),
             "OVERLAY_REFRESH_SECONDS": str(refresh_i),
             "OVERLAY_EXPAND_WIDTH": "true" if expand_width_var.get() else "false",
@@ -1304,18 +1608,18 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         }
 
         # Theme values are optional; if blank, omit them from .env.
-        if theme_font_var.get().strip():
-            values["OVERLAY_THEME_FONT_FAMILY"] = theme_font_var.get().strip()
-        if theme_text_color_var.get().strip():
-            values["OVERLAY_THEME_TEXT_COLOR"] = theme_text_color_var.get().strip()
-        if theme_card_bg_var.get().strip():
-            values["OVERLAY_THEME_CARD_BG"] = theme_card_bg_var.get().strip()
+        if tkvars["theme_font"].get().strip():
+            values["OVERLAY_THEME_FONT_FAMILY"] = tkvars["theme_font"].get().strip()
+        if tkvars["theme_text_color"].get().strip():
+            values["OVERLAY_THEME_TEXT_COLOR"] = tkvars["theme_text_color"].get().strip()
+        if tkvars["theme_card_bg"].get().strip():
+            values["OVERLAY_THEME_CARD_BG"] = tkvars["theme_card_bg"].get().strip()
         if card_radius_i is not None:
             values["OVERLAY_THEME_CARD_RADIUS_PX"] = str(card_radius_i)
-        if theme_accent_start_var.get().strip():
-            values["OVERLAY_THEME_ACCENT_START"] = theme_accent_start_var.get().strip()
-        if theme_accent_end_var.get().strip():
-            values["OVERLAY_THEME_ACCENT_END"] = theme_accent_end_var.get().strip()
+        if tkvars["theme_accent_start"].get().strip():
+            values["OVERLAY_THEME_ACCENT_START"] = tkvars["theme_accent_start"].get().strip()
+        if tkvars["theme_accent_end"].get().strip():
+            values["OVERLAY_THEME_ACCENT_END"] = tkvars["theme_accent_end"].get().strip()
         if cover_size_i is not None:
             values["OVERLAY_THEME_COVER_SIZE_PX"] = str(cover_size_i)
         if min_width_i is not None:
@@ -1335,22 +1639,25 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
         return None
 
     def on_test_connection() -> None:
+        if busy.get("test"):
+            return
         err, values = validate_inputs()
         if err:
             set_status(err, kind="error")
             return
         assert values is not None
 
+        from navidrome_api import fetch_now_playing
+
         set_status("Testing connection…", kind="working")
-        root.update_idletasks()
-        try:
-            config = load_config(env_path, overrides=values)
-            _ = fetch_now_playing(config)
-        except Exception as exc:  # pylint: disable=broad-except
-            set_status(f"Connection failed: {type(exc).__name__}: {exc}", kind="error")
-            return
 
-        set_status("Connection OK.", kind="ok")
+        run_in_background(
+            "test",
+            header_test_button,
+            lambda: fetch_now_playing(load_config(env_path, overrides=values)),
+            lambda _result: set_status("Connection OK.", kind="ok"),
+            "Connection failed",
+        )
 
     def on_save(start: bool) -> None:
         err = validate_and_save()
@@ -1369,5 +1676,7 @@ def run_gui_setup(env_path: Path) -> Optional[bool]:
     url_entry.focus_set()
     root.bind("<Escape>", lambda _event: root.destroy())
 
+    root.deiconify()
+    root.update_idletasks()
     root.mainloop()
     return start_choice["start"]